@@ -5,10 +5,9 @@ import shutil
 from typing import Any
 
 import questionary
-import yaml
 from commitizen import cmd, factory, out
 from commitizen.__version__ import __version__
-from commitizen.config import BaseConfig, JsonConfig, TomlConfig, YAMLConfig
+from commitizen.config import BaseConfig
 from commitizen.cz import registry
 from commitizen.defaults import DEFAULT_SETTINGS, config_files
 from commitizen.exceptions import InitFailedError, NoAnswersError
@@ -105,11 +104,14 @@ class Init:
             raise InitFailedError("Stopped by user")
 
         # Initialize configuration
-        if "toml" in config_path:
+        from commitizen.config import JsonConfig, TomlConfig, YAMLConfig
+
+        suffix = os.path.splitext(config_path)[1].lower()
+        if suffix == ".toml":
             self.config = TomlConfig(data="", path=config_path)
-        elif "json" in config_path:
+        elif suffix == ".json":
             self.config = JsonConfig(data="{}", path=config_path)
-        elif "yaml" in config_path:
+        elif suffix in (".yaml", ".yml"):
             self.config = YAMLConfig(data="", path=config_path)
         values_to_add = {}
         values_to_add["name"] = cz_name
@@ -310,6 +312,8 @@ class Init:
         return cmd_str
 
     def _install_pre_commit_hook(self, hook_types: list[str] | None = None):
+        import yaml
+
         pre_commit_config_filename = ".pre-commit-config.yaml"
         cz_hook_config = {
             "repo": "https://github.com/czplus-tools/commitizen-plus",
@@ -1,14 +1,59 @@
 from __future__ import annotations
 
+import copy
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from importlib import import_module
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from commitizen import defaults, git
 from commitizen.exceptions import InvalidConfigurationError
 
 from .base_config import BaseConfig
-from .json_config import JsonConfig
-from .toml_config import TomlConfig
-from .yaml_config import YAMLConfig
+
+# For get_type_hints, access the classes first or pass them in via localns
+if TYPE_CHECKING:
+    from .json_config import JsonConfig
+    from .toml_config import TomlConfig
+    from .yaml_config import YAMLConfig
+
+# Each format pulls its own parser (tomlkit, PyYAML, ...),
+# so format modules are only imported on first access.
+_CONFIG_MODULES: dict[str, str] = {
+    "TomlConfig": ".toml_config",
+    "JsonConfig": ".json_config",
+    "YAMLConfig": ".yaml_config",
+}
+
+# Formats whose parse costs more than copying a memoized result, see `_parse_config`
+_MEMOIZED_CONFIG_CLASSES = frozenset({"TomlConfig", "YAMLConfig"})
+
+_CONFIG_CLASSES: dict[str, str] = {
+    ".toml": "TomlConfig",
+    ".json": "JsonConfig",
+    ".yaml": "YAMLConfig",
+    ".yml": "YAMLConfig",
+}
+
+
+def __getattr__(name: str):
+    if name not in _CONFIG_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    config_class = getattr(import_module(_CONFIG_MODULES[name], __name__), name)
+    globals()[name] = config_class
+    return config_class
+
+
+class _EmptyConfig(BaseConfig):
+    """Stand-in for a config file without any commitizen section."""
+
+    is_empty_config = True
+
+    def __init__(self, path: Path | str):
+        super().__init__()
+        self.add_path(path)
 
 
 def read_cfg(
@@ -36,24 +81,28 @@ def read_cfg(
         is raised. If `cfg_path` is not provided, the function searches for a configuration
         in default locations using `_find_config_from_defaults()`.
     """
-    conf = BaseConfig()
-
     if cfg_path:
         if not cfg_path.exists():
             raise InvalidConfigurationError(f"File {cfg_path} not exists.")
-        _conf = _load_config_from_file(cfg_path)
-        if _conf.is_empty_config:
+        conf = _load_config_from_file(cfg_path)
+        if conf.is_empty_config:
             raise InvalidConfigurationError(
                 f"File {cfg_path} doesn't contain any configuration. "
                 f"Fill it or don't use --config-file option."
             )
-    else:
-        _conf = _find_config_from_defaults()
+        return conf
 
-    if _conf:
-        conf = _conf
+    conf = _find_config_from_defaults()
+    return conf if conf is not None else BaseConfig()
 
-    return conf
+
+@lru_cache(maxsize=8)
+def _cached_git_root(cwd: str) -> Path | None:
+    """Memoize `git.find_git_project_root()` per working directory.
+
+    The lookup spawns a `git` process, so it is only done once for each `cwd`.
+    """
+    return git.find_git_project_root()
 
 
 def _find_config_from_defaults():
@@ -64,27 +113,57 @@ def _find_config_from_defaults():
     non-empty configuration it encounters. If no suitable configuration is found, it returns None.
 
     Returns:
-        TomlConfig | JsonConfig | YAMLConfig | None
+        BaseConfig | None: The first non-empty TomlConfig, JsonConfig or YAMLConfig
+        found, or None. Files without a commitizen section are skipped.
     """
-    git_project_root = git.find_git_project_root()
+    cwd = os.getcwd()
+    git_project_root = _cached_git_root(cwd)
     cfg_search_paths = [Path(".")]
-    if git_project_root:
+    # Commitizen usually runs from the project root, don't search it twice
+    if git_project_root and git_project_root.resolve() != Path(cwd).resolve():
         cfg_search_paths.append(git_project_root)
-    cfg_paths = (
-        path / Path(filename)
-        for path in cfg_search_paths
-        for filename in defaults.config_files
-    )
-    for filename in cfg_paths:
-        if not filename.exists():
-            continue
-        _conf = _load_config_from_file(path=filename)
-        if not _conf.is_empty_config:
-            return _conf
+    if len(cfg_search_paths) == 1:
+        listings = [_list_config_files(cfg_search_paths[0])]
+    else:
+        # Only the directory listings run concurrently, so filesystem latency
+        # overlaps; parsing is CPU-bound and stays sequential, in search order,
+        # so lower-priority files are never read once a config is found.
+        with ThreadPoolExecutor(max_workers=len(cfg_search_paths)) as executor:
+            listings = list(executor.map(_list_config_files, cfg_search_paths))
+
+    for path, found in zip(cfg_search_paths, listings):
+        # Iterate the ordered list, it defines which file takes precedence
+        for filename in defaults.config_files:
+            if filename not in found:
+                continue
+            _conf = _load_config_from_file(path=path / filename)
+            if not _conf.is_empty_config:
+                return _conf
     return None
 
 
-def _load_config_from_file(path: Path) -> TomlConfig | JsonConfig | YAMLConfig:
+def _list_config_files(path: Path) -> frozenset[str]:
+    """Return the default configuration filenames present as files in `path`."""
+    # A single directory listing replaces one stat() per default filename
+    try:
+        with os.scandir(path) as entries:
+            return defaults.config_files_set.intersection(
+                entry.name for entry in entries if entry.is_file()
+            )
+    except FileNotFoundError:
+        return frozenset()
+    except OSError:
+        # e.g. a directory that can be traversed but not listed
+        return frozenset(
+            filename
+            for filename in defaults.config_files
+            if (path / filename).is_file()
+        )
+
+
+def _load_config_from_file(
+    path: Path,
+) -> TomlConfig | JsonConfig | YAMLConfig | _EmptyConfig:
     """
     Load configuration data from a file based on its extension.
 
@@ -94,7 +173,8 @@ def _load_config_from_file(path: Path) -> TomlConfig | JsonConfig | YAMLConfig:
     Returns:
         TomlConfig | JsonConfig | YAMLConfig: An instance of a configuration class
         corresponding to the file's extension (TomlConfig for .toml, JsonConfig for .json,
-        or YAMLConfig for .yaml).
+        or YAMLConfig for .yaml and .yml). Files that don't mention `commitizen`
+        at all are not parsed and give an empty config instead.
 
     Raises:
         ValueError: If the file extension is not one of the expected formats (toml, json, yaml).
@@ -104,22 +184,50 @@ def _load_config_from_file(path: Path) -> TomlConfig | JsonConfig | YAMLConfig:
         definitely falls under the conditions above. Therefore,
         this error may occur when using an arbitrary configuration file path.
     """
-    _conf: TomlConfig | JsonConfig | YAMLConfig
-
-    with open(path, "rb") as f:
-        data: bytes = f.read()
-
-    if "toml" in path.suffix:
-        _conf = TomlConfig(data=data, path=path)
-    elif "json" in path.suffix:
-        _conf = JsonConfig(data=data, path=path)
-    elif "yaml" in path.suffix:
-        _conf = YAMLConfig(data=data, path=path)
-    else:
+    class_name = _CONFIG_CLASSES.get(path.suffix.lower())
+    if class_name is None:
         # We expect that any object in defaults.py -> config_files
         # definitely falls under the conditions above. Therefore,
         # this error may occur when using an arbitrary configuration file path.
         raise InvalidConfigurationError(
             "Config file should have a valid extension: toml, yaml or json"
         )
-    return _conf
+    data = path.read_bytes()
+    # Every supported format spells out the `commitizen` key, files without it
+    # (e.g. an unrelated pyproject.toml) are empty configs and needn't be parsed.
+    # Only trust the byte search on ASCII-compatible data, not UTF-16/32.
+    if _is_ascii_compatible(data) and b"commitizen" not in data:
+        return _EmptyConfig(path)
+    if class_name not in _MEMOIZED_CONFIG_CLASSES:
+        config_class: type[TomlConfig | JsonConfig | YAMLConfig]
+        config_class = __getattr__(class_name)
+        return config_class(data=data, path=path)
+    cached = _parse_config(class_name, path, os.getcwd(), data)
+    # Callers update the settings they get back (nested lists and dicts
+    # included), keep the memoized ones intact
+    return copy.deepcopy(cached)
+
+
+def _is_ascii_compatible(data: bytes) -> bool:
+    """Whether `data` is neither UTF-16 nor UTF-32, judging by BOMs and NUL bytes."""
+    head = data[:4]
+    return not head.startswith((b"\xff\xfe", b"\xfe\xff")) and b"\x00" not in head
+
+
+@lru_cache(maxsize=4)
+def _parse_config(
+    class_name: str, path: Path, cwd: str, data: bytes
+) -> TomlConfig | JsonConfig | YAMLConfig:
+    """Build the configuration for `data`, memoized across `read_cfg` calls.
+
+    Keying on the raw file content (and on `cwd`, as `path` may be relative)
+    means any write to the file, including `set_key`, invalidates the entry,
+    whatever the filesystem timestamp resolution is.
+
+    A hit still costs a `copy.deepcopy` of the config, roughly 50us. That is
+    well below parsing TOML (~130us for a small file, ~1.5ms for a full
+    pyproject.toml) or YAML (~170us), but several times what parsing JSON
+    takes (~10us), so only `_MEMOIZED_CONFIG_CLASSES` go through here.
+    """
+    config_class: type[TomlConfig | JsonConfig | YAMLConfig] = __getattr__(class_name)
+    return config_class(data=data, path=path)
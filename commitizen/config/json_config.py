@@ -2,12 +2,33 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from typing import Any
+
 from commitizen.exceptions import InvalidConfigurationError
 
 from commitizen.git import smart_open
 
 from .base_config import BaseConfig
 
+try:
+    import orjson  # type: ignore[import-not-found, unused-ignore]
+except ImportError:
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
+
+def _loads(data: bytes | str) -> Any:
+    """Parse JSON with orjson when it is installed, else with the stdlib.
+
+    orjson rejects some input json.loads accepts (UTF-8 BOM, NaN, UTF-16/32),
+    retry those with the stdlib so the result doesn't depend on orjson.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
 
 class JsonConfig(BaseConfig):
     def __init__(self, *, data: bytes | str, path: Path | str):
@@ -46,7 +67,7 @@ class JsonConfig(BaseConfig):
         ```
         """
         try:
-            doc = json.loads(data)
+            doc = _loads(data)
         except json.JSONDecodeError as e:
             raise InvalidConfigurationError(f"Failed to parse {self.path}: {e}")
 
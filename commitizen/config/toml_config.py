@@ -1,13 +1,27 @@
 from __future__ import annotations
 
 import os
+import sys
 from pathlib import Path
+from typing import Any
 
 from tomlkit import exceptions, parse, table
 
 from commitizen.exceptions import InvalidConfigurationError
 from .base_config import BaseConfig
 
+# Reading settings doesn't need tomlkit's style-preserving document,
+# so use the faster stdlib parser when available.
+# tomlkit is still used to write back the file.
+if sys.version_info >= (3, 11):
+    import tomllib
+
+    _loads = tomllib.loads
+    _ParseError: tuple[type[Exception], ...] = (tomllib.TOMLDecodeError,)
+else:
+    _loads = parse
+    _ParseError = (exceptions.ParseError,)
+
 
 class TomlConfig(BaseConfig):
     def __init__(self, *, data: bytes | str, path: Path | str):
@@ -51,12 +65,20 @@ class TomlConfig(BaseConfig):
         name = "cz_conventional_commits"
         ```
         """
+        if isinstance(data, bytes):
+            raw = data
+            # Same fallback as tomlkit.parse(bytes), latin-1 decodes any input
+            try:
+                data = raw.decode(self.encoding)
+            except UnicodeDecodeError:
+                data = raw.decode("latin1")
         try:
-            doc = parse(data)
-        except exceptions.ParseError as e:
+            doc: dict[str, Any] = _loads(data)
+        except _ParseError as e:
             raise InvalidConfigurationError(f"Failed to parse {self.path}: {e}")
 
+        # tomlkit.exceptions.NonExistentKey is a KeyError subclass
         try:
-            self.settings.update(doc["tool"]["commitizen"])  # type: ignore
-        except exceptions.NonExistentKey:
+            self.settings.update(doc["tool"]["commitizen"])
+        except KeyError:
             self.is_empty_config = True
@@ -9,6 +9,9 @@ from commitizen.exceptions import InvalidConfigurationError
 
 from .base_config import BaseConfig
 
+# Prefer the libyaml C binding when PyYAML was built with it
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class YAMLConfig(BaseConfig):
     def __init__(self, *, data: bytes | str, path: Path | str):
@@ -31,8 +34,9 @@ class YAMLConfig(BaseConfig):
         """
         import yaml.scanner
 
+        # Keep bytes as they come: libyaml re-encodes str input to UTF-8 anyway
         try:
-            doc = yaml.safe_load(data)
+            doc = yaml.load(data, Loader=_SafeLoader)
         except yaml.YAMLError as e:
             raise InvalidConfigurationError(f"Failed to parse {self.path}: {e}")
 
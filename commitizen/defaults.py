@@ -67,6 +67,7 @@ config_files: list[str] = [
     ".cz.yaml",
     "cz.yaml",
 ]
+config_files_set: frozenset[str] = frozenset(config_files)
 encoding: str = "utf-8"
 
 DEFAULT_SETTINGS: Settings = {
@@ -10,7 +10,7 @@ import pytest
 from pytest_mock import MockerFixture
 
 from commitizen import cmd, defaults
-from commitizen.config import BaseConfig
+from commitizen.config import BaseConfig, _cached_git_root, _parse_config
 from commitizen.cz import registry
 from commitizen.cz.base import BaseCommitizen
 from commitizen.changelog_formats import (
@@ -43,6 +43,16 @@ def git_sandbox(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
     cmd.run("git config --global init.defaultBranch master")
 
 
+@pytest.fixture(autouse=True)
+def clear_config_caches():
+    """Tests move between directories and create repositories, drop memoized lookups"""
+    _cached_git_root.cache_clear()
+    _parse_config.cache_clear()
+    yield
+    _cached_git_root.cache_clear()
+    _parse_config.cache_clear()
+
+
 @pytest.fixture
 def chdir(tmp_path: Path) -> Iterator[Path]:
     cwd = os.getcwd()
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import json
 import os
+import subprocess
+import sys
 from pathlib import Path
 from typing import Any
 
@@ -11,6 +13,9 @@ import yaml
 from commitizen import config, defaults, git
 from commitizen.exceptions import InvalidConfigurationError
 
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 PYPROJECT = """
 [tool.commitizen]
 name = "cz_jira"
@@ -112,10 +117,55 @@ def config_files_manager(request, tmpdir):
             elif "json" in filename:
                 json.dump(DICT_CONFIG, f)
             elif "yaml" in filename:
-                yaml.dump(DICT_CONFIG, f)
+                yaml.dump(DICT_CONFIG, f, Dumper=SafeDumper)
         yield
 
 
+def _run_in_fresh_interpreter(code: str) -> str:
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(config.__file__).parents[2],
+    )
+    return output.stdout.strip()
+
+
+def test_import_config_does_not_load_format_parsers():
+    code = (
+        "import sys, commitizen.config; "
+        "print(sorted(m for m in sys.modules "
+        "if m.startswith(('commitizen.config.', 'yaml', 'tomlkit'))))"
+    )
+    assert _run_in_fresh_interpreter(code) == "['commitizen.config.base_config']"
+
+
+def test_type_hints_resolve_with_localns_or_after_access():
+    code = """
+import typing
+from commitizen import config
+
+localns = {name: getattr(config, name) for name in config._CONFIG_MODULES}
+hints = typing.get_type_hints(config._load_config_from_file, localns=localns)
+print(sorted(cls.__name__ for cls in typing.get_args(hints["return"])))
+
+# Accessed classes are bound in the module namespace, localns is not needed
+hints = typing.get_type_hints(config.read_cfg)
+print(sorted(cls.__name__ for cls in typing.get_args(hints["return"])))
+"""
+    assert _run_in_fresh_interpreter(code).splitlines() == [
+        "['JsonConfig', 'TomlConfig', 'YAMLConfig', '_EmptyConfig']",
+        "['BaseConfig', 'JsonConfig', 'TomlConfig', 'YAMLConfig']",
+    ]
+
+
+def test_config_classes_are_resolved_lazily():
+    assert config.YAMLConfig.__module__ == "commitizen.config.yaml_config"
+    with pytest.raises(AttributeError):
+        config.NotAConfig
+
+
 def test_find_git_project_root(tmpdir):
     assert git.find_git_project_root() == Path(os.getcwd())
 
@@ -146,6 +196,111 @@ class TestReadCfg:
             cfg = config.read_cfg()
             assert cfg.settings == defaults.DEFAULT_SETTINGS
 
+    def test_conf_skips_missing_git_project_root(_, tmpdir, mocker):
+        mocker.patch(
+            "commitizen.git.find_git_project_root",
+            return_value=Path(tmpdir) / "missing",
+        )
+        with tmpdir.as_cwd():
+            cfg = config.read_cfg()
+            assert cfg.settings == defaults.DEFAULT_SETTINGS
+
+    def test_conf_searches_git_project_root_once(_, tmp_git_project, mocker):
+        tmp_git_project.join("pyproject.toml").write("")
+        load_spy = mocker.spy(config, "_load_config_from_file")
+
+        cfg = config.read_cfg()
+
+        assert cfg.settings == defaults.DEFAULT_SETTINGS
+        assert load_spy.call_count == 1
+
+    @pytest.mark.parametrize("config_files_manager", [".cz.toml"], indirect=True)
+    def test_conf_is_parsed_once_when_unchanged(_, config_files_manager, mocker):
+        parse_spy = mocker.spy(config.TomlConfig, "_parse_setting")
+
+        cfg = config.read_cfg()
+        cfg.update({"name": "cz_conventional_commits"})
+        cfg_again = config.read_cfg()
+
+        assert parse_spy.call_count == 1
+        assert cfg_again is not cfg
+        assert cfg_again.settings == _settings
+
+    def test_load_conf_from_git_project_root(_, tmp_git_project):
+        tmp_git_project.join("pyproject.toml").write(PYPROJECT)
+        with tmp_git_project.mkdir("subdir").as_cwd():
+            cfg = config.read_cfg()
+            assert cfg.settings == _settings
+
+    def test_load_conf_prefers_cwd_over_git_project_root(_, tmp_git_project):
+        tmp_git_project.join("pyproject.toml").write(
+            PYPROJECT.replace('version = "1.0.0"', 'version = "3.0.0"')
+        )
+        subdir = tmp_git_project.mkdir("subdir")
+        subdir.join(".cz.toml").write(PYPROJECT)
+        with subdir.as_cwd():
+            cfg = config.read_cfg()
+            assert cfg.settings == _settings
+
+    @pytest.mark.parametrize("config_files_manager", [".cz.json"], indirect=True)
+    def test_json_conf_is_not_memoized(_, config_files_manager, mocker):
+        parse_spy = mocker.spy(config.JsonConfig, "_parse_setting")
+
+        config.read_cfg()
+        config.read_cfg()
+
+        assert parse_spy.call_count == 2
+
+    @pytest.mark.parametrize(
+        "config_files_manager", defaults.config_files.copy(), indirect=True
+    )
+    def test_conf_nested_mutations_do_not_leak(_, config_files_manager):
+        cfg = config.read_cfg()
+        cfg.settings["version_files"].append("MUTATED")
+        cfg.settings["style"][0].append("MUTATED")
+
+        assert config.read_cfg().settings == _settings
+
+    def test_load_conf_skips_dangling_symlink(_, tmpdir):
+        with tmpdir.as_cwd():
+            os.symlink("missing.toml", ".cz.toml")
+            with open(".cz.json", "w", encoding="utf-8") as f:
+                json.dump(DICT_CONFIG, f)
+
+            cfg = config.read_cfg()
+            assert cfg.settings == _settings
+
+    def test_load_conf_from_unlistable_dir(_, tmpdir, mocker):
+        with tmpdir.as_cwd():
+            tmpdir.join(".cz.toml").write(PYPROJECT)
+            mocker.patch("os.scandir", side_effect=PermissionError)
+
+            cfg = config.read_cfg()
+            assert cfg.settings == _settings
+
+    def test_load_conf_does_not_parse_git_project_root_when_cwd_has_config(
+        _, tmp_git_project, mocker
+    ):
+        tmp_git_project.join("pyproject.toml").write(PYPROJECT)
+        subdir = tmp_git_project.mkdir("subdir")
+        subdir.join(".cz.toml").write(PYPROJECT)
+        load_spy = mocker.spy(config, "_load_config_from_file")
+
+        with subdir.as_cwd():
+            config.read_cfg()
+
+        load_spy.assert_called_once_with(path=Path(".") / ".cz.toml")
+
+    @pytest.mark.parametrize("encoding", ["utf-16", "utf-16-le", "utf-32"])
+    def test_load_conf_from_utf16_or_utf32_json(_, tmpdir, encoding):
+        with tmpdir.as_cwd():
+            tmpdir.join(".cz.json").write_binary(
+                json.dumps(DICT_CONFIG).encode(encoding)
+            )
+
+            assert config.read_cfg().settings == _settings
+            assert config.read_cfg(cfg_path=Path(".cz.json")).settings == _settings
+
     def test_load_empty_pyproject_toml_and_cz_toml_with_config(_, tmpdir):
         with tmpdir.as_cwd():
             p = tmpdir.join("pyproject.toml")
@@ -156,6 +311,17 @@ class TestReadCfg:
             cfg = config.read_cfg()
             assert cfg.settings == _settings
 
+    def test_load_conf_skips_parsing_files_without_commitizen(_, tmpdir, mocker):
+        with tmpdir.as_cwd():
+            tmpdir.join("pyproject.toml").write("[tool.black]\nline-length = 88\n")
+            tmpdir.join(".cz.toml").write(PYPROJECT)
+            parse_spy = mocker.spy(config.TomlConfig, "_parse_setting")
+
+            cfg = config.read_cfg()
+
+            assert cfg.settings == _settings
+            assert parse_spy.call_count == 1
+
 
 class TestTomlConfig:
     def test_init_empty_config_content(self, tmpdir):
@@ -177,6 +343,13 @@ class TestTomlConfig:
         with open(path, encoding="utf-8") as toml_file:
             assert toml_file.read() == existing_content + "\n[tool.commitizen]\n"
 
+    def test_init_with_latin1_encoded_content(self, tmpdir):
+        path = tmpdir.mkdir("commitizen").join(".cz.toml")
+        data = ("# café\n" + PYPROJECT).encode("latin1")
+        toml_config = config.TomlConfig(data=data, path=path)
+
+        assert toml_config.settings == _settings
+
     def test_init_with_invalid_config_content(self, tmpdir):
         existing_content = "invalid toml content"
         path = tmpdir.mkdir("commitizen").join(".cz.toml")
@@ -194,6 +367,20 @@ class TestJsonConfig:
         with open(path, encoding="utf-8") as json_file:
             assert json.load(json_file) == {"commitizen": {}}
 
+    @pytest.mark.parametrize(
+        "data",
+        [
+            b"\xef\xbb\xbf" + json.dumps(DICT_CONFIG).encode(),
+            json.dumps(DICT_CONFIG).encode("utf-16"),
+        ],
+        ids=["utf-8-bom", "utf-16"],
+    )
+    def test_init_with_stdlib_only_content(self, tmpdir, data):
+        path = tmpdir.mkdir("commitizen").join(".cz.json")
+        json_config = config.JsonConfig(data=data, path=path)
+
+        assert json_config.settings == _settings
+
     def test_init_with_invalid_config_content(self, tmpdir):
         existing_content = "invalid json content"
         path = tmpdir.mkdir("commitizen").join(".cz.json")
@@ -209,7 +396,7 @@ class TestYamlConfig:
         yaml_config.init_empty_config_content()
 
         with open(path) as yaml_file:
-            assert yaml.safe_load(yaml_file) == {"commitizen": {}}
+            assert yaml.load(yaml_file, Loader=SafeLoader) == {"commitizen": {}}
 
     def test_init_with_invalid_content(self, tmpdir):
         existing_content = "invalid: .cz.yaml: content: maybe?"
@@ -232,6 +419,11 @@ class TestCustomFileConfig:
         with pytest.raises(InvalidConfigurationError, match=".*not exists.*"):
             config.read_cfg(cfg_path=Path("file.yaml"))
 
+    @pytest.mark.parametrize("empty_files_manager", ["file.toml"], indirect=True)
+    def test_custom_file_under_regular_file(self, empty_files_manager):
+        with pytest.raises(InvalidConfigurationError, match=".*not exists.*"):
+            config.read_cfg(cfg_path=Path("file.toml") / ".cz.toml")
+
     @pytest.mark.parametrize("empty_files_manager", ["file.toml"], indirect=True)
     def test_custom_file_is_empty_config(self, empty_files_manager):
         with pytest.raises(InvalidConfigurationError, match=".*Fill it.*"):
@@ -245,6 +437,15 @@ class TestCustomFileConfig:
         ):
             config._load_config_from_file(path=Path("file.txt"))
 
+    @pytest.mark.parametrize("filename", ["file.tomlbak", "file.jsonlike"])
+    def test_load_config_from_file_extension_lookalike(self, tmpdir, filename):
+        path = tmpdir.join(filename)
+        path.write(PYPROJECT)
+        with pytest.raises(
+            InvalidConfigurationError, match=".*should have a valid extension.*"
+        ):
+            config._load_config_from_file(path=Path(path))
+
     @pytest.mark.parametrize("config_files_manager", ["file.toml"], indirect=True)
     def test_load_config_from_custom_file(self, config_files_manager):
         cfg = config.read_cfg(cfg_path=Path("file.toml"))